@@ -1,14 +1,38 @@
-from .energy_histogram import EnergyHistogramData
-from .phase_space import PhaseSpaceData
-from .png import PNGData
-from .radiation import RadiationData
-from .sliceFieldReader import FieldSliceData
-
-
-__all__ = [
-    "EnergyHistogramData",
-    "PhaseSpaceData",
-    "PNGData",
-    "RadiationData",
-    "FieldSliceData",
-]
+import importlib
+import sys
+
+
+# readers are only imported on first access, so that e.g. using the PNG
+# reader does not pull in h5py and pandas as well (PEP 562)
+_submodule_of = {
+    "EnergyHistogramData": ".energy_histogram",
+    "PhaseSpaceData": ".phase_space",
+    "PNGData": ".png",
+    "RadiationData": ".radiation",
+    "FieldSliceData": ".sliceFieldReader",
+}
+
+
+__all__ = tuple(_submodule_of)
+
+
+def __getattr__(name):
+    if name not in _submodule_of:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name))
+
+    module = importlib.import_module(_submodule_of[name], __name__)
+    value = getattr(module, name)
+    # cache, so that __getattr__ is only called once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if sys.version_info < (3, 7):
+    # module level __getattr__ is not supported, import everything eagerly
+    for _name in __all__:
+        __getattr__(_name)
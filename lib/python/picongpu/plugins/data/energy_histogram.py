@@ -139,15 +139,10 @@ class EnergyHistogramData(DataReader):
             delimiter=" "
         )
         # upper range of each bin in keV
-        #    note: only reads first row and selects the valid energy bins
-        bins = pd.read_csv(
-            data_file_path,
-            comment=None,
-            nrows=0,
-            delimiter=" ",
-            usecols=range(2, data.shape[1] - 2),
-            dtype=np.float64
-        ).columns.values.astype(np.float64)
+        #    note: taken from the header row that was already parsed as
+        #          column names, skipping iteration, underflow, overflow
+        #          and sum columns
+        bins = data.columns.values[2:-2].astype(np.float64)
 
         # set DataFrame column names properly
         data.columns = [
@@ -176,11 +176,8 @@ class PhaseSpaceData(DataReader):
 
         iterations = np.array(
             sorted(
-                map(
-                    lambda file_path:
-                    np.uint64(re_it.match(file_path).group(1)),
-                    matching_files
-                )
+                np.uint64(re_it.match(file_path).group(1))
+                for file_path in matching_files
             ),
             dtype=np.uint64
         )
@@ -219,6 +216,7 @@ class PhaseSpaceData(DataReader):
         if iteration is None:
             raise ValueError('The iteration needs to be set!')
 
+        # also verifies that the file for the requested iteration exists
         data_file_path, data_hdf5_name = self.get_data_path(
             species,
             species_filter,
@@ -226,12 +224,6 @@ class PhaseSpaceData(DataReader):
             iteration
         )
 
-        available_iterations = self.get_iterations(species, species_filter, ps)
-        if iteration not in available_iterations:
-            raise IndexError('Iteration {} is not available!\n'
-                             'List of available iterations: \n'
-                             '{}'.format(iteration, available_iterations))
-
         f = h5.File(data_file_path, 'r')
         ps_data = f[data_hdf5_name]
 
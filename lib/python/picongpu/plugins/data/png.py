@@ -8,7 +8,6 @@ License: GPLv3+
 from .base_reader import DataReader
 
 import os
-from scipy import misc
 import collections
 
 SPECIES_LONG_NAMES = {
@@ -71,7 +70,14 @@ class PNGData(DataReader):
         if axis is None:
             raise ValueError('The axis parameter can not be None!')
 
-        dir_name = "png" + SPECIES_LONG_NAMES.get(species) + axis.upper()
+        try:
+            species_long_name = SPECIES_LONG_NAMES[species]
+        except KeyError:
+            raise ValueError('The species {} is not known! Known species '
+                             'are: {}'.format(species,
+                                              list(SPECIES_LONG_NAMES)))
+
+        dir_name = "png" + species_long_name + axis.upper()
 
         output_dir = os.path.join(
             self.run_directory,
@@ -90,12 +96,7 @@ class PNGData(DataReader):
             return output_dir
         else:
             if slice_point is None:
-                # determine slice point manually as the slice point of the
-                # first png file in alphabetical order
-                slice_point = [
-                    f.split("_")[3] for f in sorted(os.listdir(output_dir)) if
-                    f.endswith(".png")][0]
-                slice_point = float(slice_point)
+                slice_point = self._find_slice_point(output_dir)
 
             data_file_name = self.data_file_prefix.format(
                 species,
@@ -117,6 +118,29 @@ class PNGData(DataReader):
 
             return data_file_path
 
+    def _find_slice_point(self, output_dir):
+        """
+        Determine the slice point as the slice point of the first png file
+        in alphabetical order.
+
+        Parameters
+        ----------
+        output_dir: string
+            path to the directory containing the png files
+
+        Returns
+        -------
+        A float with the relative offset in the third axis.
+        """
+        png_files = [
+            f for f in sorted(os.listdir(output_dir)) if f.endswith(".png")]
+        if not png_files:
+            raise IOError('The directory {} does not contain any png files.\n'
+                          'Did the simulation already run?'
+                          .format(output_dir))
+
+        return float(png_files[0].split("_")[3])
+
     def get_iterations(self, species, species_filter='all', axis=None,
                        slice_point=None):
         """
@@ -197,6 +221,16 @@ class PNGData(DataReader):
             # iteration is None, so we use all available data
             iteration = available_iterations
 
+        if slice_point is None and len(iteration) > 0:
+            # resolve once here instead of listing the png directory again
+            # for each requested iteration
+            slice_point = self._find_slice_point(
+                self.get_data_path(species, species_filter, axis))
+
+        # scipy is only needed for actually reading images, so do not pay
+        # for its import when only paths or iterations are queried
+        from scipy import misc
+
         imgs = {it: misc.imread(
             self.get_data_path(species, species_filter, axis,
                                slice_point, it)) for it in iteration}
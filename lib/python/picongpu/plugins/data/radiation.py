@@ -84,18 +84,30 @@ class RadiationData:
 
     def get_Spectra(self):
         """Returns real spectra in [Js]."""
-        return (np.abs(self.get_Amplitude_x())**2 +
-                np.abs(self.get_Amplitude_y())**2 +
-                np.abs(self.get_Amplitude_z())**2)
+        return (self.get_Polarization_X() +
+                self.get_Polarization_Y() +
+                self.get_Polarization_Z())
 
     def get_Polarization_X(self):
         """Returns real spectra for x-polarization in [Js]."""
-        return np.abs(self.get_Amplitude_x())**2
+        return self._get_intensity(self.h5_Ax_Re, self.h5_Ax_Im)
 
     def get_Polarization_Y(self):
         """Returns real spectra for y-polarization in [Js]."""
-        return np.abs(self.get_Amplitude_y())**2
+        return self._get_intensity(self.h5_Ay_Re, self.h5_Ay_Im)
 
     def get_Polarization_Z(self):
         """Returns real spectra for z-polarization in [Js]."""
-        return np.abs(self.get_Amplitude_z())**2
+        return self._get_intensity(self.h5_Az_Re, self.h5_Az_Im)
+
+    def _get_intensity(self, h5_Re, h5_Im):
+        """
+        Returns the absolute square of a complex amplitude component in [Js].
+
+        Computed as Re^2 + Im^2 from the real and imaginary data sets,
+        which avoids building the complex amplitude and taking its
+        absolute value just to square it again.
+        """
+        amplitude_Re = h5_Re.value[:, :, 0]
+        amplitude_Im = h5_Im.value[:, :, 0]
+        return (amplitude_Re**2 + amplitude_Im**2) * self.convert_to_SI
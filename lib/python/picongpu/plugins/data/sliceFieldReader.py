@@ -45,39 +45,35 @@ def FieldSliceData(File):
         # if neither throw error
         raise IOError("the argument - {} - is not a file".format(File))
 
-    # determine size of slice:
+    # determine size of slice while collecting all lines with entries
     N_x = None
-    N_y = 0
+    valid_lines = []
 
     for line in theFile:
         # count number of vectors in line
         N_x_local = line.count('{')
 
+        # skip lines without entries
+        if N_x_local == 0:
+            continue
+
         # check whether number of vectors stays constant
-        if N_x is not None:
-            # none avoid initial line with no entry number yet
-            if N_x_local != N_x and N_x_local > 0:
-                raise IOError("number of entries differs between lines")
-
-        # add number of lines with valid entries
-        if N_x_local > 0:
-            N_y += 1
-            # set N_x if line was valid
-            N_x = N_x_local
-
-    # create data storage for slice of field data
-    data = _numpy.empty((N_y, N_x, 3))
-
-    # read file again
-    theFile.seek(0)
-
-    # go through all valid lines
-    for y in range(N_y):
-        line = theFile.readline().split()
-        # go through all valid field vectors
-        for x in range(N_x):
-            fieldValue = line[x]
-            data[y, x, :] = [float(x) for x in fieldValue[1:-1].split(',')]
+        if N_x is not None and N_x_local != N_x:
+            raise IOError("number of entries differs between lines")
+
+        N_x = N_x_local
+        valid_lines.append(line)
+
+    N_y = len(valid_lines)
+
+    # field vectors are written as {x,y,z}: drop braces and commas and
+    # convert all values at once instead of parsing each vector separately
+    values = " ".join(valid_lines)
+    for separator in "{},":
+        values = values.replace(separator, " ")
+
+    data = _numpy.array(values.split(), dtype=_numpy.float64).reshape(
+        (N_y, N_x, 3))
     return data
 
 
@@ -1,9 +1,37 @@
-from .energy_histogram_visualizer import Visualizer as \
-    EnergyHistogramMPL
-from .phase_space_visualizer import Visualizer as PhaseSpaceMPL
-from .png_visualizer import Visualizer as PNGMPL
+import importlib
+import sys
 
 
-__all__ = ["EnergyHistogramMPL",
-           "PhaseSpaceMPL",
-           "PNGMPL"]
+# visualizers are only imported on first access, so that importing this
+# package does not load matplotlib and all data readers (PEP 562)
+_submodule_of = {
+    "EnergyHistogramMPL": ".energy_histogram_visualizer",
+    "PhaseSpaceMPL": ".phase_space_visualizer",
+    "PNGMPL": ".png_visualizer",
+}
+
+
+__all__ = tuple(_submodule_of)
+
+
+def __getattr__(name):
+    if name not in _submodule_of:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name))
+
+    module = importlib.import_module(_submodule_of[name], __name__)
+    # all visualizer modules name their class ``Visualizer``
+    value = module.Visualizer
+    # cache, so that __getattr__ is only called once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if sys.version_info < (3, 7):
+    # module level __getattr__ is not supported, import everything eagerly
+    for _name in __all__:
+        __getattr__(_name)
@@ -91,7 +91,7 @@ def parse(file, ptype):
     if ptype == "compile":
         ostr = [to_macro_name(name) + "=" + str(value)
                 for name, value in filtered_dict.items()]
-        cxx_defines = ";".join(map(lambda s: "-D" + s, ostr))
+        cxx_defines = ";".join("-D" + s for s in ostr)
         return "-DPARAM_OVERWRITES:LIST='" + cxx_defines + "'"
 
     elif ptype == "run":